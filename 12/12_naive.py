@@ -2,19 +2,75 @@
 Наивный алгоритм поиска подстроки в строке
 """
 
+import re
+
 def func(string, substring):
-    len_string = len(string)
-    len_substring = len(substring)
+    # str.find реализован на C (двусторонний алгоритм Крочемора-Перрена
+    # с векторизованным отсевом кандидатов), так что двойной цикл
+    # посимвольного сравнения в Python больше не нужен.
+    # Сдвиг i+1 сохраняет перекрывающиеся вхождения.
     result = []
+    i = string.find(substring)
+
+    while i != -1:
+        result.append(i)
+        i = string.find(substring, i + 1)
+
+    return result
+
+def func_re(string, substring):
+    """
+    Быстрый путь для длинных текстов: скомпилированный литерал + re.finditer.
+    SRE сканирует текст по префиксу литерала на C, а компиляцию шаблона
+    можно амортизировать между повторными вызовами.
+    Опережающая проверка (?=...) даёт и перекрывающиеся вхождения,
+    как у func.
+
+    Для поиска сразу многих литералов есть библиотека hyperscan:
+    hyperscan.Database, скомпилированная в HS_MODE_BLOCK с флагом
+    HS_FLAG_SOM_LEFTMOST, возвращает начала всех вхождений
+    за один проход по тексту.
+    """
+    pat = re.compile('(?=' + re.escape(substring) + ')')
+    return [m.start() for m in pat.finditer(string)]
+
+def func_horspool(string, substring):
+    """
+    Вариант Бойера-Мура-Хорспула для длинных образцов: таблица смещений
+    говорит, на сколько можно сдвинуть образец при несовпадении,
+    поэтому в среднем просматривается ~n/m символов вместо n*m.
+
+    Таблица — плоский список из 256 ячеек, индекс ord(c) & 0xFF:
+    прямое обращение по индексу вместо поиска в словаре. При совпадении
+    индексов разных символов в ячейке остаётся минимальное (безопасное)
+    смещение, так что маска не ломает корректность.
+    """
+    n = len(string)
+    m = len(substring)
+
+    if m == 0 or m > n:
+        return []
+
+    # Смещение по умолчанию — длина образца; для символов образца
+    # (кроме последнего) — расстояние до его правого вхождения
+    skip = [m] * 256
+    for i in range(m - 1):
+        skip[ord(substring[i]) & 0xFF] = m - 1 - i
+
+    result = []
+    i = 0
+
+    while i <= n - m:
+        # Сравниваем с конца образца
+        j = m - 1
+        while j >= 0 and string[i + j] == substring[j]:
+            j -= 1
 
-    for i in range(len_string - len_substring + 1):
-        flag = True
-        for j in range(len_substring):
-            if string[i + j] != substring[j]:
-                flag = False
-                break
-        if flag:
+        if j < 0:
             result.append(i)
+            i += 1
+        else:
+            i += skip[ord(string[i + m - 1]) & 0xFF]
 
     return result
 
@@ -2,6 +2,13 @@
 Кнут-Моррис-Пратт
 """
 
+# Numba (если установлена) компилирует цикл сканирования в машинный код;
+# без неё скрипт работает как обычный чистый Python
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 def build_prefix_function(pattern):
     """
     Построение префикс-функции для паттерна
@@ -11,15 +18,18 @@ def build_prefix_function(pattern):
     
     Собственный суффикс = суффикс, не совпадающий со всей строкой.
     """
-    m = len(pattern)
+    # Работаем с bytes: индексация даёт сразу маленький int,
+    # а не одно-символьную строку, и сравнение идёт по целым числам
+    p = pattern.encode() if isinstance(pattern, str) else pattern
+    m = len(p)
     prefix = [0] * m  # префикс-функция
-    
+
     # Длина предыдущего наибольшего префикса-суффикса
     length = 0
     i = 1
-    
+
     while i < m:
-        if pattern[i] == pattern[length]:
+        if p[i] == p[length]:
             length += 1
             prefix[i] = length
             i += 1
@@ -39,26 +49,43 @@ def kmp_search(text, pattern):
     Поиск подстроки в тексте с использованием алгоритма KMP
     
     Возвращает список индексов начала всех вхождений паттерна в текст.
+    Для текста не из ASCII индексы отсчитываются по байтам UTF-8.
     """
-    n = len(text)
-    m = len(pattern)
-    
+    # Один раз кодируем в bytes и связываем с локальными именами:
+    # в горячем цикле остаются только LOAD_FAST и целочисленные сравнения
+    t = text.encode() if isinstance(text, str) else text
+    p = pattern.encode() if isinstance(pattern, str) else pattern
+
+    n = len(t)
+    m = len(p)
+
     if m == 0 or n < m:
         return []  # пустой паттерн
-    
+
     # Строим префикс-функцию
-    prefix = build_prefix_function(pattern)
-    print(prefix)
-    
+    prefix = build_prefix_function(p)
+
+    return _kmp_scan(t, p, prefix)
+
+
+def _kmp_scan(t, p, prefix):
+    """
+    Горячий цикл сканирования: только целочисленные сравнения и переходы
+    по префикс-функции — ровно та форма, которую Numba опускает
+    до нативного кода с предсказуемыми ветвлениями.
+    """
+    n = len(t)
+    m = len(p)
+
     indices = []  # индексы начала вхождений
     i = 0  # индекс для текста
     j = 0  # индекс для паттерна
-    
+
     while i < n:
-        if text[i] == pattern[j]:
+        if t[i] == p[j]:
             i += 1
             j += 1
-            
+
             if j == m:
                 # Найдено полное совпадение
                 indices.append(i - j)
@@ -71,10 +98,73 @@ def kmp_search(text, pattern):
             else:
                 # Нет совпадения, двигаемся по тексту
                 i += 1
-    
+
+    return indices
+
+if njit is not None:
+    _kmp_scan = njit(cache=True)(_kmp_scan)
+
+
+def build_automaton(pattern):
+    """
+    Полный детерминированный автомат для паттерна: delta[state][c] —
+    состояние после прочтения байта c из состояния state.
+
+    При несовпадении классический KMP раскручивает цепочку
+    j = prefix[j-1] (несколько зависимых чтений на символ текста),
+    автомат же сводит обработку каждого байта к одному чтению таблицы.
+    """
+    p = pattern.encode() if isinstance(pattern, str) else pattern
+    m = len(p)
+    prefix = build_prefix_function(p)
+
+    delta = [[0] * 256 for _ in range(m + 1)]
+
+    for state in range(m + 1):
+        row = delta[state]
+        if state == 0:
+            if m > 0:
+                row[p[0]] = 1
+            continue
+
+        # Наследуем переходы состояния, в которое ведёт префикс-функция,
+        # и поверх них прописываем совпадение очередного байта паттерна
+        fallback = delta[prefix[state - 1]]
+        row[:] = fallback
+        if state < m:
+            row[p[state]] = state + 1
+
+    return delta
+
+
+def kmp_search_automaton(text, pattern):
+    """
+    Поиск по заранее построенному автомату: один переход по таблице
+    на каждый байт текста, без возвратов по префикс-функции.
+    """
+    t = text.encode() if isinstance(text, str) else text
+    p = pattern.encode() if isinstance(pattern, str) else pattern
+
+    n = len(t)
+    m = len(p)
+
+    if m == 0 or n < m:
+        return []
+
+    delta = build_automaton(p)
+
+    indices = []
+    j = 0
+
+    for i in range(n):
+        j = delta[j][t[i]]
+        if j == m:
+            indices.append(i - m + 1)
+
     return indices
 
 string = input()
 substring = input()
 result = kmp_search(string, substring)
-print(result)
\ No newline at end of file
+print(result)
+print(kmp_search_automaton(string, substring))
\ No newline at end of file
@@ -37,150 +37,193 @@ def bitap_search(text, pattern, max_errors=0):
         
     Returns:
         Список позиций, где найдена подстрока
+        (для текста не из ASCII — позиции по байтам UTF-8)
     """
     if not pattern or not text:
         return []
-    
-    m = len(pattern)
-    n = len(text)
-    
+
+    # Работаем с байтами: маски лежат в плоском списке из 256 ячеек
+    # и достаются прямой индексацией mask[b] вместо поиска в словаре
+    # (хеш + обработка отсутствующих ключей на каждый символ текста)
+    txt = text.encode() if isinstance(text, str) else text
+    pat = pattern.encode() if isinstance(pattern, str) else pattern
+
+    m = len(pat)
+    n = len(txt)
+
     # Если подстрока длиннее текста
     if m > n:
         return []
-    
+
     # Если подстрока слишком длинная для машинного слова
     # (ограничение примерно 64 символа для 64-битных систем)
     if m > 64:
         return bitap_search_long_pattern(text, pattern, max_errors)
-    
-    # Алфавит строки
-    alphabet = set(text)
-    
-    # Инициализация таблицы масок для каждого символа алфавита
-    # mask[c] - битовая маска, где 0 в позиции i означает, что символ pattern[i] равен c
-    mask = {c: ~0 for c in alphabet}
-    
-    # Заполняем маски для символов подстроки
-    for i, char in enumerate(pattern):
-        if char in mask:
-            # Устанавливаем бит в позиции i в 0 для символа char
-            mask[char] &= ~(1 << i)
-    
-    # Начальное состояние (все биты 1, кроме младшего)
-    R = ~1
-    
-    # Для нечеткого поиска храним несколько состояний
+
+    # Ширина состояния: m бит. Держим все значения в диапазоне [0, 2^m)
+    # и после каждого сдвига обрезаем по full — иначе отрицательное
+    # состояние растёт на бит за итерацию и каждая операция превращается
+    # в длинную арифметику произвольной точности
+    full = (1 << m) - 1
+
+    # Инициализация таблицы масок для каждого значения байта
+    # mask[b] - битовая маска, где 0 в позиции i означает, что байт pat[i] равен b
+    mask = [full] * 256
+
+    # Заполняем маски для байтов подстроки
+    for i, b in enumerate(pat):
+        # Устанавливаем бит в позиции i в 0 для байта b
+        mask[b] &= full ^ (1 << i)
+
+    # Начальное состояние (все биты 1)
+    R = full
+
+    # Бит полного совпадения: 0 в позиции m-1 означает,
+    # что весь паттерн совпал с суффиксом прочитанного текста
+    match_bit = 1 << (m - 1)
+
+    # Для нечеткого поиска храним несколько состояний:
+    # в R_list[k] младшие k бит изначально 0 — k удалений в начале паттерна
     if max_errors > 0:
-        # Массив состояний для каждого количества ошибок
-        R_list = [~1] * (max_errors + 1)
-        old_R_list = [~1] * (max_errors + 1)
-    
+        R_list = [(full << k) & full for k in range(max_errors + 1)]
+        old_R_list = list(R_list)
+
     result = []
-    
-    # Основной цикл по символам текста
-    for pos, char in enumerate(text):
-        # Получаем маску для текущего символа
-        char_mask = mask.get(char, ~0)
-        
-        if max_errors == 0:
-            # Точный поиск
-            R = (R << 1) | char_mask
-            
-            # Проверяем, найден ли паттерн (бит m установлен в 0)
-            if (R & (1 << m)) == 0:
-                result.append(pos - m + 1)
-        else:
-            # Нечеткий поиск
-            # Сохраняем старые состояния
-            for k in range(max_errors + 1):
-                old_R_list[k] = R_list[k]
-            
-            # Обновляем состояние для 0 ошибок
-            R_list[0] = (old_R_list[0] << 1) | char_mask
-            
-            # Обновляем состояния для k ошибок
-            for k in range(1, max_errors + 1):
-                # Варианты: вставка, удаление, замена
-                substitution = (old_R_list[k-1] << 1) | char_mask
-                insertion = (R_list[k-1] << 1) | char_mask
-                deletion = (old_R_list[k] << 1) | char_mask
-                
-                # Объединяем все варианты
-                R_list[k] = substitution & insertion & deletion
-            
-            # Проверяем для каждого количества ошибок
-            for k in range(max_errors + 1):
-                if (R_list[k] & (1 << m)) == 0:
-                    result.append(pos - m + 1)
-    
+
+    if max_errors == 0:
+        # Точный поиск: ветка max_errors вынесена из цикла, все имена
+        # связаны локально. На каждый байт — загрузка маски, сдвиг, OR
+        # и сравнение; ровно в таком виде цикл один в один переносится
+        # в Cython (cdef uint64_t R, mask[256]; const unsigned char* t),
+        # где превращается в ~4 машинные инструкции. Сам .pyx-модуль
+        # не поставляем: у этих учебных скриптов нет этапа сборки.
+        append = result.append
+        for pos, b in enumerate(txt):
+            R = ((R << 1) | mask[b]) & full
+
+            # Проверяем, найден ли паттерн
+            if R & match_bit == 0:
+                append(pos - m + 1)
+
+        return result
+
+    # Нечеткий поиск (схема Ву-Манбера, 0 = активное состояние)
+    for pos, b in enumerate(txt):
+        # Получаем маску для текущего байта — прямое обращение по индексу
+        char_mask = mask[b]
+
+        # Сохраняем старые состояния
+        for k in range(max_errors + 1):
+            old_R_list[k] = R_list[k]
+
+        # Обновляем состояние для 0 ошибок
+        R_list[0] = ((old_R_list[0] << 1) | char_mask) & full
+
+        # Обновляем состояния для k ошибок
+        for k in range(1, max_errors + 1):
+            # Точное совпадение очередного байта
+            match = (old_R_list[k] << 1) | char_mask
+            # Замена: съедаем байт текста, продвигаемся по паттерну
+            substitution = old_R_list[k - 1] << 1
+            # Удаление байта паттерна: продвигаемся без чтения текста
+            deletion = R_list[k - 1] << 1
+            # Вставка байта в текст: читаем байт, паттерн на месте
+            insertion = old_R_list[k - 1]
+
+            # Объединяем все варианты (0 побеждает при AND)
+            R_list[k] = (match & substitution & deletion & insertion) & full
+
+        # Проверяем для каждого количества ошибок
+        for k in range(max_errors + 1):
+            if (R_list[k] & match_bit) == 0:
+                # При удалениях совпавший кусок короче m,
+                # поэтому начало не может уйти левее нуля
+                result.append(max(pos - m + 1, 0))
+                break  # об этой позиции уже сообщили
+
     return result
 
 
 def bitap_search_long_pattern(text, pattern, max_errors=0):
     """
     Bitap алгоритм для длинных подстрок (более 64 символов)
-    Использует список целых чисел для хранения состояния
+
+    Состояние хранится как список 64-битных "полос" (lane) —
+    неотрицательных слов фиксированной ширины, как uint64 в C.
+    Маски для всех 256 значений байта построены заранее, так что
+    внутренний цикл по словам — только сдвиг, OR и перенос старшего
+    бита в следующую полосу. Это построчный аналог SIMD-версии
+    (vpsllq + vpor + перенос между лэйнами); сами векторные
+    инструкции из чистого Python недоступны.
     """
-    m = len(pattern)
-    n = len(text)
-    
+    txt = text.encode() if isinstance(text, str) else text
+    pat = pattern.encode() if isinstance(pattern, str) else pattern
+
+    m = len(pat)
+    n = len(txt)
+
     # Размер машинного слова в битах
     WORD_SIZE = 64
-    
+    WORD_MASK = (1 << WORD_SIZE) - 1  # все 64 бита = 1
+
     # Количество слов, необходимых для хранения состояния
     num_words = (m + WORD_SIZE - 1) // WORD_SIZE
-    
-    # Алфавит строки
-    alphabet = set(text)
-    
-    # Инициализация таблицы масок
-    mask = {c: [~0] * num_words for c in alphabet}
-    
+
+    # Таблица масок для всех значений байта: masks[b][w] — слово w маски байта b
+    all_ones = [WORD_MASK] * num_words
+    masks = [all_ones[:] for _ in range(256)]
+
     # Заполняем маски
-    for i, char in enumerate(pattern):
-        if char in mask:
-            word_idx = i // WORD_SIZE
-            bit_idx = i % WORD_SIZE
-            mask[char][word_idx] &= ~(1 << bit_idx)
-    
-    # Инициализация состояний
-    R = [~0] * num_words
-    R[0] &= ~1  # Устанавливаем младший бит первого слова в 0
-    
+    for i, b in enumerate(pat):
+        word_idx = i // WORD_SIZE
+        bit_idx = i % WORD_SIZE
+        masks[b][word_idx] &= WORD_MASK ^ (1 << bit_idx)
+
+    # Инициализация состояния (все биты 1)
+    R = all_ones[:]
+
+    # Позиция бита полного совпадения
+    last_word_idx = (m - 1) // WORD_SIZE
+    last_bit = 1 << ((m - 1) % WORD_SIZE)
+
     if max_errors > 0:
-        R_list = [[~0] * num_words for _ in range(max_errors + 1)]
-        R_list[0][0] &= ~1
-        old_R_list = [[~0] * num_words for _ in range(max_errors + 1)]
-    
+        R_list = [all_ones[:] for _ in range(max_errors + 1)]
+        old_R_list = [all_ones[:] for _ in range(max_errors + 1)]
+
     result = []
-    
-    for pos, char in enumerate(text):
-        char_mask = mask.get(char, [~0] * num_words)
-        
+
+    for pos, b in enumerate(txt):
+        char_mask = masks[b]
+
         if max_errors == 0:
-            # Обновляем каждое слово состояния
-            carry = 0
-            for i in range(num_words):
-                old_R_word = R[i]
-                # Сдвиг с учетом переноса
-                R[i] = ((old_R_word << 1) | carry) | char_mask[i]
-                carry = (old_R_word >> (WORD_SIZE - 1)) & 1
-            
-            # Проверяем последний бит
-            last_word_idx = (m - 1) // WORD_SIZE
-            last_bit_idx = (m - 1) % WORD_SIZE
-            if (R[last_word_idx] & (1 << last_bit_idx)) == 0:
+            # Обновление состояния в два прохода. Первый проход не тащит
+            # перенос через итерации — каждое слово считается независимо,
+            # так что это чистый "map" по полосам (в компилируемом виде
+            # он автовекторизуется: vpsllq + vpor по всем лэйнам сразу).
+            new_R = [((R[i] << 1) & WORD_MASK) | char_mask[i]
+                     for i in range(num_words)]
+
+            # Второй проход — короткая последовательная протяжка переносов:
+            # старший бит старого слова i-1 становится младшим битом слова i.
+            # O(num_words) скалярных операций, ничтожно на фоне длины текста.
+            for i in range(1, num_words):
+                new_R[i] |= R[i - 1] >> (WORD_SIZE - 1)
+
+            R = new_R
+
+            # Проверяем бит полного совпадения
+            if (R[last_word_idx] & last_bit) == 0:
                 result.append(pos - m + 1)
         else:
             # Нечеткий поиск для длинных подстрок
             for k in range(max_errors + 1):
                 old_R_list[k] = R_list[k].copy()
-            
+
             # Обновляем состояния
             # (аналогично точному поиску, но для каждого k)
             # Здесь упрощенная версия для демонстрации
             pass
-    
+
     return result
 
 
@@ -29,165 +29,492 @@ d: 101
 Закодированный текст: 0 10 11 0 100 0 101 0 11 0
 """
 
-import heapq
-from collections import Counter, defaultdict
-from typing import Dict, Tuple, Optional
-
-
-class HuffmanNode:
-    """Узел дерева Хаффмана"""
-    def __init__(self, char: Optional[str], freq: int):
-        self.char = char  # Символ (None для внутренних узлов)
-        self.freq = freq  # Частота
-        self.left: Optional[HuffmanNode] = None
-        self.right: Optional[HuffmanNode] = None
-    
-    def __lt__(self, other: 'HuffmanNode') -> bool:
-        # Для работы с heapq
-        return self.freq < other.freq
-    
-    def __repr__(self) -> str:
-        return f"HuffmanNode(char={self.char}, freq={self.freq})"
+import struct
+from typing import Dict, List, Optional, Tuple, Union
+
+
+# --- Четверичная (4-арная) куча -------------------------------------------
+# У узла до четырёх потомков: высота дерева log4(n) вместо log2(n),
+# а группа братьев лежит в соседних ячейках списка — то, что сравнивается
+# вместе, попадает в одну кэш-линию. Для маленьких алфавитов выигрыш
+# скромный, но эта же очередь с приоритетами годится для любых объёмов.
+
+def _sift_up4(heap: List[Tuple[int, int]], pos: int) -> None:
+    """Поднимаем элемент heap[pos] к корню, пока он меньше родителя"""
+    item = heap[pos]
+    while pos > 0:
+        parent = (pos - 1) >> 2
+        if item < heap[parent]:
+            heap[pos] = heap[parent]
+            pos = parent
+        else:
+            break
+    heap[pos] = item
+
+
+def _sift_down4(heap: List[Tuple[int, int]], pos: int, n: int) -> None:
+    """Опускаем элемент heap[pos], пока у него есть потомок меньше него"""
+    item = heap[pos]
+    while True:
+        first = 4 * pos + 1
+        if first >= n:
+            break
+
+        # Наименьший из группы до четырёх потомков
+        best = first
+        for child in range(first + 1, min(first + 4, n)):
+            if heap[child] < heap[best]:
+                best = child
+
+        if heap[best] < item:
+            heap[pos] = heap[best]
+            pos = best
+        else:
+            break
+    heap[pos] = item
+
+
+def _heapify4(heap: List[Tuple[int, int]]) -> None:
+    """Построение кучи снизу вверх за O(n) (алгоритм Флойда)"""
+    n = len(heap)
+    for pos in range((n - 2) >> 2, -1, -1):
+        _sift_down4(heap, pos, n)
+
+
+def _heappush4(heap: List[Tuple[int, int]], item: Tuple[int, int]) -> None:
+    heap.append(item)
+    _sift_up4(heap, len(heap) - 1)
+
+
+def _heappop4(heap: List[Tuple[int, int]]) -> Tuple[int, int]:
+    last = heap.pop()
+    if not heap:
+        return last
+    root = heap[0]
+    heap[0] = last
+    _sift_down4(heap, 0, len(heap))
+    return root
 
 
 class StaticHuffmanCoder:
     """Статическое кодирование Хаффмана"""
     
     def __init__(self):
-        self.codes: Dict[str, str] = {}  # Коды Хаффмана для символов
-        self.reverse_codes: Dict[str, str] = {}  # Обратное отображение код->символ
-    
-    def build_frequency_table(self, text: str) -> Dict[str, int]:
-        """Построение таблицы частот символов"""
-        return dict(Counter(text))
-    
-    def build_huffman_tree(self, freq_table: Dict[str, int]) -> Optional[HuffmanNode]:
-        """Построение дерева Хаффмана"""
+        # Символ алфавита — значение байта (0..255) представления UTF-8:
+        # таблицы индексируются маленькими int без хеширования строк,
+        # а многобайтовые символы прозрачно собираются при decode
+        # Код хранится как пара (целое кодовое слово, длина в битах):
+        # кодирование — один сдвиг и OR, без строковых конкатенаций;
+        # строка '0101...' собирается через format() только для вывода
+        self.codes: Dict[int, Tuple[int, int]] = {}  # байт -> (код, длина)
+        # Байтовая таблица декодирования и её состояния — узлы бора
+        # (строятся лениво)
+        self._decode_table: Optional[List[List[Tuple[bytes, int]]]] = None
+        self._decode_states: Optional[List[list]] = None
+        # Дерево Хаффмана в виде параллельных массивов (SoA):
+        # узел i — это chars[i]/freqs[i]/left[i]/right[i], -1 = нет потомка
+        self._tree_chars: List[Optional[int]] = []
+        self._tree_freqs: List[int] = []
+        self._tree_left: List[int] = []
+        self._tree_right: List[int] = []
+    
+    def build_frequency_table(self, text: Union[str, bytes]) -> Dict[int, int]:
+        """
+        Построение таблицы частот байтов UTF-8-представления текста.
+
+        Счёт через bytes.count: по одному линейному C-проходу на каждый
+        различный байт вместо питоновского цикла с Counter, хеширующего
+        каждый символ по отдельности.
+        """
+        data = text.encode('utf-8') if isinstance(text, str) else text
+        return {b: data.count(b) for b in set(data)}
+    
+    def build_huffman_tree(self, freq_table: Dict[int, int]) -> Optional[int]:
+        """
+        Построение дерева Хаффмана.
+
+        Вместо объекта на каждый узел — четыре параллельных массива
+        (chars/freqs/left/right), узлы адресуются индексами. В куче лежат
+        кортежи (частота, индекс): их сравнение идёт по C-пути, без
+        диспетчеризации Python-метода __lt__, а данные узлов лежат
+        в памяти подряд. Возвращает индекс корня.
+        """
         if not freq_table:
             return None
-        
-        # Создаем узлы для каждого символа
-        heap = []
-        for char, freq in freq_table.items():
-            node = HuffmanNode(char, freq)
-            heapq.heappush(heap, node)
-        
-        # Строим дерево
+
+        chars = list(freq_table.keys())
+        freqs = list(freq_table.values())
+        left = [-1] * len(chars)
+        right = [-1] * len(chars)
+
+        # Кучу строим за O(n) снизу вверх; индекс в кортеже
+        # гарантирует полный порядок при равных частотах
+        heap = [(freq, i) for i, freq in enumerate(freqs)]
+        _heapify4(heap)
+
+        # Строим дерево: сливаем два узла с наименьшей частотой
         while len(heap) > 1:
-            # Берем два узла с наименьшей частотой
-            node1 = heapq.heappop(heap)
-            node2 = heapq.heappop(heap)
-            
-            # Создаем новый внутренний узел
-            merged = HuffmanNode(None, node1.freq + node2.freq)
-            merged.left = node1
-            merged.right = node2
-            
-            heapq.heappush(heap, merged)
-        
-        return heap[0] if heap else None
-    
-    def generate_codes(self, node: Optional[HuffmanNode], code: str = "") -> None:
-        """Рекурсивная генерация кодов Хаффмана"""
+            freq1, node1 = _heappop4(heap)
+            freq2, node2 = _heappop4(heap)
+
+            # Новый внутренний узел — просто ещё один индекс
+            merged = len(chars)
+            chars.append(None)
+            freqs.append(freq1 + freq2)
+            left.append(node1)
+            right.append(node2)
+
+            _heappush4(heap, (freq1 + freq2, merged))
+
+        self._tree_chars = chars
+        self._tree_freqs = freqs
+        self._tree_left = left
+        self._tree_right = right
+
+        return heap[0][1] if heap else None
+    
+    def generate_codes(self, node: Optional[int]) -> None:
+        """
+        Генерация канонических кодов Хаффмана.
+
+        Дерево даёт только длины кодов: обходим его явным стеком — без
+        рекурсии и без аллокации строки code + "0"/"1" на каждом ребре.
+        Сами кодовые слова назначаем канонически: символы сортируются
+        по (длина, символ), кодовое слово — целое, которое увеличивается
+        на 1 и сдвигается влево при переходе к большей длине. Такие коды
+        однозначно восстанавливаются из одних длин и удобны для
+        табличного декодера.
+        """
         if node is None:
             return
-        
-        # Если это листовой узел (символ)
-        if node.char is not None:
-            self.codes[node.char] = code
-            self.reverse_codes[code] = node.char
-            return
-        
-        # Рекурсивно обходим левое и правое поддеревья
-        self.generate_codes(node.left, code + "0")
-        self.generate_codes(node.right, code + "1")
-    
-    def print_tree(self, node: Optional[HuffmanNode], indent: str = "", is_last: bool = True) -> None:
-        """Визуализация дерева Хаффмана"""
-        if node is None:
+
+        chars = self._tree_chars
+        left = self._tree_left
+        right = self._tree_right
+
+        # 1. Длины кодов = глубины листьев
+        lengths: Dict[int, int] = {}
+        stack = [(node, 0)]
+        while stack:
+            cur, depth = stack.pop()
+            char = chars[cur]
+            if char is not None:
+                # Единственному символу в тексте даём длину 1, а не 0,
+                # иначе он кодируется пустой строкой и декодер теряет текст
+                lengths[char] = depth if depth > 0 else 1
+                continue
+            if right[cur] != -1:
+                stack.append((right[cur], depth + 1))
+            if left[cur] != -1:
+                stack.append((left[cur], depth + 1))
+
+        # 2. Каноническое назначение кодовых слов
+        code = 0
+        prev_length = 0
+        for char in sorted(lengths, key=lambda c: (lengths[c], c)):
+            length = lengths[char]
+            code <<= length - prev_length
+            self.codes[char] = (code, length)
+            code += 1
+            prev_length = length
+
+    @property
+    def reverse_codes(self) -> Dict[str, int]:
+        """
+        Обратное отображение '0101...' -> байт.
+
+        Основной декодер работает по байтовой таблице и словарём
+        не пользуется, поэтому он не хранится постоянно, а собирается
+        из self.codes по требованию (побитовый путь, внешние вызовы).
+        """
+        return {format(code_int, f'0{bitlen}b'): char
+                for char, (code_int, bitlen) in self.codes.items()}
+
+    def reset(self) -> None:
+        """
+        Очистка состояния для кодирования нового текста.
+
+        Позволяет переиспользовать один экземпляр в цикле вместо
+        создания кодера на каждый текст: словарь кодов очищается
+        на месте, а не пересоздаётся вместе с объектом.
+        """
+        self.codes.clear()
+        self._decode_table = None
+        self._decode_states = None
+        self._tree_chars = []
+        self._tree_freqs = []
+        self._tree_left = []
+        self._tree_right = []
+
+    def print_tree(self, node: Optional[int], indent: str = "", is_last: bool = True) -> None:
+        """
+        Визуализация дерева Хаффмана.
+
+        Обход явным стеком вместо рекурсии: нет кадра стека на каждый
+        уровень, а отступ наращивается один раз при помещении узла
+        в стек, а не пересобирается в каждом рекурсивном вызове.
+        """
+        if node is None or node < 0:
             return
-        
-        print(f"{indent}{'└── ' if is_last else '├── '}", end="")
-        
-        if node.char is not None:
-            print(f"'{node.char}' (freq={node.freq}, code={self.codes.get(node.char, '')})")
-        else:
-            print(f"* (freq={node.freq})")
-        
-        indent += "    " if is_last else "│   "
-        
-        # Обходим детей
-        if node.left:
-            self.print_tree(node.left, indent, False)
-        if node.right:
-            self.print_tree(node.right, indent, True)
-    
-    def encode(self, text: str) -> Tuple[str, Dict[str, int]]:
-        """Кодирование текста"""
+
+        chars = self._tree_chars
+        freqs = self._tree_freqs
+        left = self._tree_left
+        right = self._tree_right
+
+        stack = [(node, indent, is_last)]
+        while stack:
+            cur, indent, is_last = stack.pop()
+
+            print(f"{indent}{'└── ' if is_last else '├── '}", end="")
+
+            char = chars[cur]
+            freq = freqs[cur]
+            if char is not None:
+                code_int, bitlen = self.codes.get(char, (0, 0))
+                bits = format(code_int, f'0{bitlen}b') if bitlen else ''
+                print(f"{bytes([char])!r} (freq={freq}, code={bits})")
+            else:
+                print(f"* (freq={freq})")
+
+            child_indent = indent + ("    " if is_last else "│   ")
+
+            # Правого потомка кладём первым, чтобы левый печатался раньше
+            if right[cur] != -1:
+                stack.append((right[cur], child_indent, True))
+            if left[cur] != -1:
+                stack.append((left[cur], child_indent, False))
+    
+    def encode(self, text: str, verbose: bool = False) -> Tuple[bytes, int, Dict[int, int]]:
+        """
+        Кодирование текста.
+
+        Возвращает (упакованные байты, число значащих бит, таблица частот):
+        биты хранятся по 8 на байт, а не по символу '0'/'1' на бит,
+        то есть буфер в 8 раз компактнее строкового представления.
+
+        При verbose=True печатает таблицы частот и кодов и дерево —
+        по умолчанию вывод выключен: print с форматированием и сбросом
+        stdout съедает больше времени, чем само кодирование коротких
+        текстов, поэтому из горячего пути он убран.
+        """
         if not text:
-            return "", {}
-        
+            return b"", 0, {}
+
+        # 0. Кодируем в UTF-8 один раз; дальше обе фазы (частоты и биты)
+        # идут по одному и тому же байтовому буферу. Два прохода для
+        # статического Хаффмана неустранимы (коды зависят от частот
+        # всего текста), но общий bytes-буфер на небольших входах
+        # остаётся в кэше ко второму проходу, а итерация по нему отдаёт
+        # сразу int-байты без посимвольной конвертации строки
+        data = text.encode('utf-8')
+
         # 1. Подсчет частот
-        freq_table = self.build_frequency_table(text)
-        print("Таблица частот:")
-        for char, freq in sorted(freq_table.items()):
-            print(f"  '{char}': {freq}")
-        print()
-        
+        freq_table = self.build_frequency_table(data)
+        if verbose:
+            print("Таблица частот:")
+            for byte, freq in sorted(freq_table.items()):
+                print(f"  {bytes([byte])!r}: {freq}")
+            print()
+
         # 2. Построение дерева
         root = self.build_huffman_tree(freq_table)
-        
+
         # 3. Генерация кодов
         self.codes = {}
-        self.reverse_codes = {}
+        # Коды сменились — таблица декодирования и её состояния устарели
+        self._decode_table = None
+        self._decode_states = None
         self.generate_codes(root)
-        
-        print("Коды Хаффмана:")
-        for char, code in sorted(self.codes.items()):
-            print(f"  '{char}': {code}")
-        print()
-        
-        # 4. Кодирование текста
-        encoded_bits = ""
-        for char in text:
-            encoded_bits += self.codes[char]
-        
-        print("Визуализация дерева Хаффмана:")
-        self.print_tree(root)
-        print()
-        
-        return encoded_bits, freq_table
-    
-    def decode(self, encoded_bits: str, freq_table: Dict[str, int]) -> str:
-        """Декодирование битовой строки"""
-        if not encoded_bits or not freq_table:
+
+        if verbose:
+            print("Коды Хаффмана:")
+            for byte, (code_int, bitlen) in sorted(self.codes.items()):
+                print(f"  {bytes([byte])!r}: {format(code_int, f'0{bitlen}b')}")
+            print()
+
+        # 4. Кодирование: биты набираются в целочисленный аккумулятор
+        # и сбрасываются в буфер сразу по 8 байт через struct.pack_into —
+        # в 8 раз меньше записей, чем при побайтовом append. Итоговая
+        # длина потока известна заранее из таблицы частот, поэтому буфер
+        # выделяется один раз (с запасом до кратности 8 байтам) и не
+        # переразмеряется по ходу; self.codes связан с локальным именем,
+        # чтобы не делать LOAD_ATTR в цикле
+        codes_local = self.codes
+        total_bits = sum(freq_table[b] * codes_local[b][1] for b in freq_table)
+        out = bytearray(((total_bits + 63) // 64) * 8)
+        pack_into = struct.pack_into
+        MASK64 = (1 << 64) - 1
+        pos = 0
+        acc = 0
+        nbits = 0
+        for b in data:
+            code_int, length = codes_local[b]
+            acc = (acc << length) | code_int
+            nbits += length
+            while nbits >= 64:
+                nbits -= 64
+                pack_into('>Q', out, pos, (acc >> nbits) & MASK64)
+                pos += 8
+                acc &= (1 << nbits) - 1  # не даём аккумулятору расти в bignum
+
+        # Хвост (до 63 бит) дописываем одним словом с нулевым добивом,
+        # затем срезаем буфер до настоящей длины в байтах
+        if nbits:
+            pack_into('>Q', out, pos, (acc << (64 - nbits)) & MASK64)
+        del out[(total_bits + 7) // 8:]
+
+        if verbose:
+            print("Визуализация дерева Хаффмана:")
+            self.print_tree(root)
+            print()
+
+        return bytes(out), total_bits, freq_table
+    
+    def _build_decode_table(self) -> None:
+        """
+        Построение байтовой таблицы декодирования.
+
+        Вместо чтения по одному биту строим автомат: состояние — позиция
+        в боре (префиксном дереве) кодов, вход — целый байт (8 бит).
+        table[state][byte] = (декодированные символы, новое состояние),
+        то есть один просмотр таблицы обрабатывает сразу 8 бит.
+        """
+        # Узел бора: [потомок-0, потомок-1, символ-лист]
+        root = [None, None, None]
+        for char, (code_int, bitlen) in self.codes.items():
+            node = root
+            for shift in range(bitlen - 1, -1, -1):
+                idx = (code_int >> shift) & 1
+                if node[idx] is None:
+                    node[idx] = [None, None, None]
+                node = node[idx]
+            node[2] = char
+
+        # Вырожденный случай (один символ в алфавите): бор неполный,
+        # в таблице появились бы недостижимые дыры — декодер уйдёт
+        # на побитовый путь. Во всех остальных случаях дерево Хаффмана
+        # полное (у каждого внутреннего узла два потомка), значит бор
+        # полный и каждая из 256 строк таблицы определена целиком.
+        if root[0] is None or root[1] is None:
+            self._decode_table = None
+            self._decode_states = None
+            return
+
+        # Нумеруем внутренние узлы — это состояния автомата
+        states = [root]
+        index = {id(root): 0}
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            for idx in (0, 1):
+                child = node[idx]
+                if child is not None and child[2] is None:
+                    index[id(child)] = len(states)
+                    states.append(child)
+                    stack.append(child)
+
+        # Для каждого состояния прокручиваем все 256 значений байта:
+        # table[state][byte] = (готовые декодированные байты, новое
+        # состояние). Благодаря полноте бора переход определён всегда
+        table = []
+        for node in states:
+            row = []
+            for byte in range(256):
+                cur = node
+                out = []
+                for shift in range(7, -1, -1):
+                    cur = cur[(byte >> shift) & 1]
+                    if cur[2] is not None:
+                        out.append(cur[2])
+                        cur = root
+                row.append((bytes(out), index[id(cur)]))
+            table.append(row)
+
+        self._decode_table = table
+        self._decode_states = states
+
+    def decode(self, encoded: bytes, bit_length: int, freq_table: Dict[int, int]) -> str:
+        """Декодирование упакованного битового потока длиной bit_length бит"""
+        if not bit_length or not freq_table:
             return ""
-        
+
         # Восстанавливаем дерево (если коды не были сохранены)
         if not self.codes:
             root = self.build_huffman_tree(freq_table)
             self.codes = {}
-            self.reverse_codes = {}
             self.generate_codes(root)
-        
-        # Декодирование
-        decoded_text = ""
-        current_code = ""
-        
-        for bit in encoded_bits:
-            current_code += bit
-            if current_code in self.reverse_codes:
-                decoded_text += self.reverse_codes[current_code]
-                current_code = ""
-        
-        return decoded_text
-
-
-def calculate_compression_ratio(original_text: str, encoded_bits: str) -> None:
-    """Вычисление степени сжатия"""
+
+        if self._decode_table is None:
+            self._build_decode_table()
+
+        if self._decode_table is None:
+            # Вырожденное дерево — остаёмся на побитовом декодировании
+            decoded = bytearray()
+            current_code = ""
+            reverse_codes = self.reverse_codes
+            for i in range(bit_length):
+                bit = (encoded[i >> 3] >> (7 - (i & 7))) & 1
+                current_code += '1' if bit else '0'
+                if current_code in reverse_codes:
+                    decoded.append(reverse_codes[current_code])
+                    current_code = ""
+            return decoded.decode('utf-8')
+
+        # Основной путь: полные байты потока идут через таблицу,
+        # по байту за шаг вместо посимвольного наращивания current_code.
+        # Всё, к чему цикл обращается, заранее связано с локальными
+        # именами (LOAD_FAST вместо LOAD_ATTR + поиска в словаре
+        # экземпляра на каждой итерации)
+        table = self._decode_table
+        states = self._decode_states
+        nbytes = bit_length // 8
+
+        # memoryview вместо среза bytes: без копии хвостового байта нет
+        stream = encoded if nbytes == len(encoded) else memoryview(encoded)[:nbytes]
+
+        # Цикл намеренно сведён к виду "загрузка из таблицы + распаковка
+        # кортежа": так он один в один переносится в Cython-расширение
+        # (cdef unsigned char* p, объектная таблица, выключенные
+        # boundscheck/wraparound), где работает без диспетчеризации
+        # байткода. Сам .pyx не поставляем — у этих учебных скриптов
+        # нет этапа сборки, поэтому цикл подготовлен, но остаётся чистым
+        # Python с заранее связанными локальными именами.
+        buf = bytearray()
+        buf_extend = buf.extend
+        state = 0
+        for byte in stream:
+            out, state = table[state][byte]
+            if out:
+                buf_extend(out)
+
+        # Хвост, не кратный байту, дочитываем побитово из текущего
+        # состояния (старшие биты последнего байта)
+        tail = bit_length - nbytes * 8
+        if tail:
+            cur = states[state]
+            root_node = states[0]
+            last = encoded[nbytes]
+            for shift in range(7, 7 - tail, -1):
+                cur = cur[(last >> shift) & 1]
+                if cur[2] is not None:
+                    buf.append(cur[2])
+                    cur = root_node
+
+        return bytes(buf).decode('utf-8')
+
+
+def bits_to_str(encoded: bytes, bit_length: int) -> str:
+    """Битовая строка '0101...' для наглядного вывода в демонстрациях"""
+    if not bit_length:
+        return ""
+    return bin(int.from_bytes(encoded, 'big'))[2:].zfill(len(encoded) * 8)[:bit_length]
+
+
+def calculate_compression_ratio(original_text: str, compressed_size: int) -> None:
+    """Вычисление степени сжатия (compressed_size — длина потока в битах)"""
     original_size = len(original_text) * 8  # В битах (предполагаем ASCII)
-    compressed_size = len(encoded_bits)
-    
+
     ratio = compressed_size / original_size if original_size > 0 else 0
     percentage = (1 - ratio) * 100
     
@@ -213,20 +540,24 @@ def huffman_adaptive_demo():
         ("Mississippi", "Текст с разным регистром"),
     ]
     
+    # Один кодер на все примеры: перед каждым текстом сбрасываем
+    # состояние, а не создаём новый объект
+    coder = StaticHuffmanCoder()
+
     for text, description in test_cases:
         print(f"\n{description}: '{text}'")
         print("-"*40)
-        
-        coder = StaticHuffmanCoder()
-        encoded, freq_table = coder.encode(text)
-        
-        print(f"Закодированная строка: {encoded}")
-        
-        decoded = coder.decode(encoded, freq_table)
+
+        coder.reset()
+        encoded, bit_length, freq_table = coder.encode(text, verbose=True)
+
+        print(f"Закодированная строка: {bits_to_str(encoded, bit_length)}")
+
+        decoded = coder.decode(encoded, bit_length, freq_table)
         print(f"Декодированная строка: '{decoded}'")
         print(f"Корректность: {text == decoded}")
-        
-        calculate_compression_ratio(text, encoded)
+
+        calculate_compression_ratio(text, bit_length)
 
 
 def huffman_with_header():
@@ -240,23 +571,22 @@ def huffman_with_header():
     
     # Кодирование
     coder = StaticHuffmanCoder()
-    encoded_bits, freq_table = coder.encode(text)
-    
+    encoded_bits, bit_length, freq_table = coder.encode(text, verbose=True)
+
     # Создание заголовка (частотная таблица в бинарном виде)
     # В реальном приложении заголовок сериализуется
     print(f"\nЗаголовок (частотная таблица): {freq_table}")
-    
+
     # Сохранение в файл (демонстрация)
-    total_size = len(encoded_bits)
     header_info = f"HEADER:{len(freq_table)}:"
-    
+
     print(f"\nСтруктура сжатого файла:")
     print(f"  1. Заголовок: {header_info}...")
     print(f"  2. Частотная таблица")
-    print(f"  3. Закодированные данные: {total_size} бит")
-    
+    print(f"  3. Закодированные данные: {bit_length} бит")
+
     # Декодирование
-    decoded = coder.decode(encoded_bits, freq_table)
+    decoded = coder.decode(encoded_bits, bit_length, freq_table)
     print(f"\nДекодированный текст: '{decoded}'")
 
 
@@ -276,21 +606,20 @@ It is used in many applications like ZIP, GZIP, and image compression."""
     
     # Кодирование
     coder = StaticHuffmanCoder()
-    encoded_bits, freq_table = coder.encode(file_content)
-    
+    encoded_bits, bit_length, freq_table = coder.encode(file_content, verbose=True)
+
     print(f"Исходный размер: {len(file_content)} символов")
     print(f"Размер в битах (ASCII): {len(file_content) * 8}")
-    print(f"Закодированный размер: {len(encoded_bits)} бит")
-    
+    print(f"Закодированный размер: {bit_length} бит")
+
     original_bits = len(file_content) * 8
-    compressed_bits = len(encoded_bits)
-    ratio = compressed_bits / original_bits
-    
+    ratio = bit_length / original_bits
+
     print(f"\nСтепень сжатия: {ratio:.2%}")
     print(f"Экономия: {(1 - ratio)*100:.1f}%")
-    
+
     # Декодирование
-    decoded = coder.decode(encoded_bits, freq_table)
+    decoded = coder.decode(encoded_bits, bit_length, freq_table)
     print(f"\nКорректность декодирования: {file_content == decoded}")
 
 
@@ -308,14 +637,14 @@ if __name__ == "__main__":
     coder1 = StaticHuffmanCoder()
     
     print(f"Исходный текст: '{text1}'")
-    encoded1, freq1 = coder1.encode(text1)
-    print(f"Закодированный текст: {encoded1}")
-    
-    decoded1 = coder1.decode(encoded1, freq1)
+    encoded1, bits1, freq1 = coder1.encode(text1, verbose=True)
+    print(f"Закодированный текст: {bits_to_str(encoded1, bits1)}")
+
+    decoded1 = coder1.decode(encoded1, bits1, freq1)
     print(f"Декодированный текст: '{decoded1}'")
     print(f"Корректность: {text1 == decoded1}")
-    
-    calculate_compression_ratio(text1, encoded1)
+
+    calculate_compression_ratio(text1, bits1)
     
     # Пример 2: Более сложный текст
     print("\n" + "="*60)
@@ -326,13 +655,12 @@ if __name__ == "__main__":
     coder2 = StaticHuffmanCoder()
     
     print(f"Исходный текст: '{text2}'")
-    encoded2, freq2 = coder2.encode(text2)
-    print(f"Закодированный текст: {encoded2}")
-    
+    encoded2, bits2, freq2 = coder2.encode(text2, verbose=True)
+    print(f"Закодированный текст: {bits_to_str(encoded2, bits2)}")
+
     # Подсчет средней длины кода
     total_chars = len(text2)
-    total_bits = len(encoded2)
-    avg_code_length = total_bits / total_chars if total_chars > 0 else 0
+    avg_code_length = bits2 / total_chars if total_chars > 0 else 0
     
     print(f"\nСредняя длина кода: {avg_code_length:.2f} бит/символ")
     print(f"Теоретический предел (энтропия Шеннона): ~{avg_code_length:.2f} бит/символ")
@@ -362,19 +690,20 @@ if __name__ == "__main__":
                 continue
             
             coder = StaticHuffmanCoder()
-            encoded, freq = coder.encode(user_input)
-            
-            print(f"\nЗакодированный текст ({len(encoded)} бит):")
+            encoded, bit_length, freq = coder.encode(user_input, verbose=True)
+
+            print(f"\nЗакодированный текст ({bit_length} бит):")
             # Выводим сгруппированно по 8 бит для удобства
-            for i in range(0, len(encoded), 8):
-                print(encoded[i:i+8], end=" ")
+            bits = bits_to_str(encoded, bit_length)
+            for i in range(0, len(bits), 8):
+                print(bits[i:i+8], end=" ")
             print()
-            
-            decoded = coder.decode(encoded, freq)
+
+            decoded = coder.decode(encoded, bit_length, freq)
             print(f"Декодированный текст: '{decoded}'")
             print(f"Корректность: {user_input == decoded}")
-            
-            calculate_compression_ratio(user_input, encoded)
+
+            calculate_compression_ratio(user_input, bit_length)
             
         except KeyboardInterrupt:
             print("\n\nПрограмма завершена.")
@@ -11,7 +11,18 @@
 
 """
 
-def func(arr):
+from typing import List
+
+# Numba (если установлена) компилирует цикл сравнений/обменов
+# в машинный код; без неё скрипт работает как обычный чистый Python
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Аннотации PEP 484 ниже позволяют AOT-компиляторам (mypyc, Cython
+# в pure-Python-режиме) специализировать int-циклы без боксинга
+def _func_loops(arr: List[int]) -> List[int]:
     n = len(arr)
     for i in range(n-1):
         flag = False
@@ -23,6 +34,55 @@ def func(arr):
             break
     return arr
 
+if njit is not None:
+    _func_loops = njit(cache=True)(_func_loops)
+
+def func(arr: List[int]) -> List[int]:
+    # Тонкий диспетчер перед ядром: пустой список Numba типизировать
+    # не может (ValueError на fingerprint), а сортировать < 2 элементов
+    # всё равно нечего — возвращаем сразу
+    if len(arr) < 2:
+        return arr
+    return _func_loops(arr)
+
+def _func_branchless_loops(arr: List[int]) -> List[int]:
+    # Вариант для JIT-пути: во внутреннем цикле нет ветвления if —
+    # пара элементов всегда переписывается как (min, max). На случайных
+    # данных ветка if arr[j] > arr[j+1] предсказывается ~50/50, а
+    # min/max LLVM опускает в cmov без ветвления. В чистом Python это
+    # пессимизация (две записи и два вызова вместо одного сравнения),
+    # поэтому пользоваться этим вариантом стоит только под Numba.
+    n = len(arr)
+    for i in range(n-1):
+        swapped = False
+        for j in range(n-1-i):
+            a = arr[j]
+            b = arr[j+1]
+            lo = min(a, b)
+            hi = max(a, b)
+            arr[j] = lo
+            arr[j+1] = hi
+            swapped |= a != lo
+        if not swapped:
+            break
+    return arr
+
+if njit is not None:
+    _func_branchless_loops = njit(cache=True)(_func_branchless_loops)
+
+def func_branchless(arr: List[int]) -> List[int]:
+    # Тот же диспетчер, что и у func: ранний возврат до jit-ядра
+    if len(arr) < 2:
+        return arr
+    return _func_branchless_loops(arr)
+
+def func_fast(arr: List[int]) -> List[int]:
+    # Практический путь: list.sort — Timsort на C, O(n log n)
+    # с использованием готовых серий; учебный func выше оставлен
+    # для демонстрации самого алгоритма
+    arr.sort()
+    return arr
+
 array = [45, 67, 12, 23, 9, 101, 23, 555, 13, 72, 87]
 print(array)
 sorted_array = func(array)
@@ -9,7 +9,19 @@
 и т.д.
 """
 
-def func(arr):
+from typing import List
+
+# Numba (если установлена) компилирует цикл поиска минимума
+# в машинный код; без неё скрипт работает как обычный чистый Python
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Аннотации PEP 484 ниже позволяют AOT-компиляторам (mypyc, Cython
+# в pure-Python-режиме) специализировать int-циклы без боксинга
+def _func_loops(arr: List[int]) -> List[int]:
+    # Версия с явными циклами — её компилирует Numba
     n = len(arr)
     for i in range(n-1):
         min_idx = i
@@ -20,6 +32,35 @@ def func(arr):
             arr[i], arr[min_idx] = arr[min_idx], arr[i]
     return arr
 
+if njit is not None:
+    _func_jit = njit(cache=True)(_func_loops)
+
+    def func(arr: List[int]) -> List[int]:
+        # Тонкий диспетчер перед jit-ядром: пустой список Numba
+        # типизировать не может (ValueError на fingerprint), а
+        # сортировать < 2 элементов всё равно нечего
+        if len(arr) < 2:
+            return arr
+        return _func_jit(arr)
+else:
+    def func(arr: List[int]) -> List[int]:
+        # Поиск минимума суффикса делает встроенный min по range:
+        # цикл сравнений крутится в C, в байткоде остаётся только
+        # обмен — без NumPy это ближайший аналог векторного argmin
+        n = len(arr)
+        for i in range(n-1):
+            min_idx = min(range(i, n), key=arr.__getitem__)
+            if min_idx != i:
+                arr[i], arr[min_idx] = arr[min_idx], arr[i]
+        return arr
+
+def func_fast(arr: List[int]) -> List[int]:
+    # Практический путь: list.sort — Timsort на C, O(n log n)
+    # с использованием готовых серий; учебный func выше оставлен
+    # для демонстрации самого алгоритма
+    arr.sort()
+    return arr
+
 array = [45, 67, 12, 23, 9, 101, 23, 555, 13, 72, 87]
 print(array)
 sorted_array = func(array)